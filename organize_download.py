@@ -12,20 +12,65 @@ A smart download folder organizer that:
 import time
 import shutil
 import argparse
+import atexit
+import errno
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import re
+import signal
+import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import (
+    FileSystemEventHandler, FileClosedEvent, FileCreatedEvent, FileModifiedEvent, FileMovedEvent
+)
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # optional; falls back to the json module
+    orjson = None
+
+try:
+    from watchdog.observers.inotify import InotifyObserver
+except Exception:  # inotify is only available on Linux
+    InotifyObserver = None
 
 # Constants
 TEMP_EXTS = {'.crdownload', '.part', '.tmp', '.download'}
 MARKER_FILE = ".organized"  # used to mark that first-time setup has already run
 CONFIG_FILE = ".organize_config.json"
 LOG_FILE = ".organize_log.txt"
+TEMP_SUFFIXES = tuple(TEMP_EXTS)  # for str.endswith on lower-cased paths
+INTERNAL_FILES = frozenset({MARKER_FILE, CONFIG_FILE, LOG_FILE})  # the organizer's own files
+LOG_BUFFER_SIZE = 8192  # bytes buffered before the log file is written
+LOG_FLUSH_INTERVAL = 1.0  # seconds between periodic log file flushes
+CLEANUP_LOG_EVERY = 1000  # first-run cleanup logs progress once per this many items
+MOVE_WORKERS = 4  # threads that move files so the watcher never blocks on I/O
+STATS_INTERVAL = 60.0  # seconds between running-total log lines
+LOCK_RECHECK_DELAY = 0.5  # seconds before re-checking a file another process has locked
+RETRY_BACKOFF = 0.01  # first wait (seconds) before retrying a locked file; doubles each attempt
+
+# With inotify a finished download is signalled by close-after-write or by being
+# renamed into place, so only those events (plus creates, which is how a file
+# moved in from another folder is reported) are subscribed to. Other platforms
+# fall back to debouncing create/modify events.
+USE_INOTIFY = InotifyObserver is not None and Observer is InotifyObserver
+if USE_INOTIFY:
+    WATCHED_EVENTS = [FileClosedEvent, FileCreatedEvent, FileMovedEvent]
+else:
+    WATCHED_EVENTS = [FileCreatedEvent, FileModifiedEvent, FileMovedEvent]
 
 # Default file categories and their extensions
 DEFAULT_CATEGORIES = {
@@ -37,6 +82,8 @@ DEFAULT_CATEGORIES = {
     "executables": ['.exe', '.msi', '.apk', '.dmg', '.app', '.deb', '.rpm'],
     "code": ['.py', '.js', '.html', '.css', '.java', '.c', '.cpp', '.php', '.rb', '.go', '.json', '.xml', '.sql']
 }
+# Freeze the lists and intern the extensions so index lookups match by identity
+DEFAULT_CATEGORIES = {k: tuple(sys.intern(e) for e in v) for k, v in DEFAULT_CATEGORIES.items()}
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -49,14 +96,47 @@ DEFAULT_CONFIG = {
     "log_level": "INFO",
     "keep_original_name": True,
     "rename_duplicates": True,
-    "max_retry_attempts": 3,
-    "retry_delay_seconds": 2
+    "max_retry_attempts": 3
 }
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that buffers writes and leaves flushing to a background thread."""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+def start_flush_thread(handler, interval=LOG_FLUSH_INTERVAL):
+    """Flush a buffered handler every `interval` seconds so the log can be tailed."""
+    def run():
+        while True:
+            time.sleep(interval)
+            handler.flush()
+
+    thread = threading.Thread(target=run, name="log-flush", daemon=True)
+    thread.start()
+    return thread
+
+
 def setup_logging(downloads_dir, level="INFO"):
-    """Configure logging to both console and file."""
+    """
+    Configure logging to both console and file.
+
+    Records are queued by the calling thread and written by a QueueListener
+    thread, so file I/O never blocks the watcher.
+    """
     log_path = downloads_dir / LOG_FILE
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     
     # Create a logger
     logger = logging.getLogger("organize_downloads")
@@ -65,98 +145,214 @@ def setup_logging(downloads_dir, level="INFO"):
     
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
     
     # File handler
-    file_handler = logging.FileHandler(log_path)
-    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-    logger.addHandler(file_handler)
+    file_handler = BufferedFileHandler(log_path)
+    file_handler.setFormatter(formatter)
+    start_flush_thread(file_handler)
+    
+    # Hand records to a background listener that owns the real handlers
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     return logger
 
 
+if orjson is not None:
+    def json_loads(data):
+        return orjson.loads(data)
+
+    def json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+else:
+    def json_loads(data):
+        return json.loads(data)
+
+    def json_dumps(obj):
+        return json.dumps(obj, indent=2).encode()
+
+
 def load_config(downloads_dir):
     """Load or create configuration file."""
     config_path = downloads_dir / CONFIG_FILE
     
     if config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                # Merge with defaults to ensure all keys exist
-                merged_config = DEFAULT_CONFIG.copy()
-                merged_config.update(config)
-                return merged_config
+            config = json_loads(config_path.read_bytes())
+            # Merge with defaults to ensure all keys exist
+            merged_config = DEFAULT_CONFIG.copy()
+            merged_config.update(config)
+            return prepare_config(merged_config)
         except Exception as e:
             print(f"Error loading config file: {e}. Using defaults.")
-            return DEFAULT_CONFIG
+            return prepare_config(DEFAULT_CONFIG.copy())
     else:
-        # Create default config file
-        with open(config_path, 'w') as f:
-            json.dump(DEFAULT_CONFIG, f, indent=4)
+        # Create default config file; write a uniquely named temp file and rename
+        # it into place so an interrupted or concurrent write never leaves a
+        # truncated config behind
+        fd, tmp_path = tempfile.mkstemp(dir=downloads_dir, prefix=CONFIG_FILE, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json_dumps(DEFAULT_CONFIG))
+            os.replace(tmp_path, config_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
         print(f"Created default configuration at {config_path}")
-        return DEFAULT_CONFIG
+        return prepare_config(DEFAULT_CONFIG.copy())
+
+
+def prepare_config(config):
+    """Add lookup tables derived from the loaded settings (keys start with '_')."""
+    # Invert categories into extension -> category; the first category listing an
+    # extension wins, matching the order categories are declared in
+    ext_index = {}
+    for category, extensions in config["categories"].items():
+        for ext in extensions:
+            ext_index.setdefault(sys.intern(ext), category)
+    config["_ext_index"] = ext_index
+    
+    # Exact-name exclusions become a set, and patterns are compiled once; an
+    # invalid pattern is reported and skipped rather than discarding the config
+    config["excluded_files"] = frozenset(config["excluded_files"])
+    compiled = []
+    for pattern in config["excluded_patterns"]:
+        try:
+            compiled.append(re.compile(pattern, re.IGNORECASE))
+        except re.error as e:
+            print(f"Ignoring invalid excluded pattern {pattern!r}: {e}")
+    config["_excluded_res"] = tuple(compiled)
+    
+    return config
+
+
+def fast_move(src, dst):
+    """
+    Move a file with a single rename, falling back to shutil.move (copy +
+    unlink) only when src and dst are on different filesystems.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, dst)
+
+
+def writer_done(file_path):
+    """
+    Return False if another process holds an exclusive lock on the file.
+    Uses a non-blocking flock probe where fcntl is available; elsewhere (and
+    if the file can't be opened) it reports True and leaves it to the move.
+    """
+    if fcntl is None:
+        return True
+    try:
+        fd = os.open(file_path, os.O_RDONLY | os.O_NONBLOCK)
+    except OSError:
+        return True
+    try:
+        fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+    finally:
+        os.close(fd)  # also releases our shared lock
 
 
-def get_category(file_path, categories):
+def get_category(file_path, config):
     """Determine the category of a file based on its extension."""
-    ext = file_path.suffix.lower()
-    
-    for category, extensions in categories.items():
-        if ext in extensions:
-            return category
-    
-    return "other"
+    ext = sys.intern(os.path.splitext(file_path)[1].lower())
+    return config["_ext_index"].get(ext, "other")
 
 
 def is_excluded(file_path, config):
     """Check if a file should be excluded from organization."""
+    name = os.path.basename(file_path)
+    
     # Check for exact filename match
-    if file_path.name in config["excluded_files"]:
+    if name in config["excluded_files"]:
         return True
     
     # Check for pattern matches
-    for pattern in config["excluded_patterns"]:
-        if re.search(pattern, file_path.name, re.IGNORECASE):
-            return True
-    
-    return False
+    return any(regex.search(name) for regex in config["_excluded_res"])
 
 
-def get_destination_path(src_path, download_dir, config):
-    """Determine the destination path for a file based on configuration."""
-    date_folder = datetime.now().strftime('%Y-%m-%d')
-    
-    # Start with download_dir as the base
-    dest_dir = download_dir
+# [second, formatted date] for the last call to today()
+_date_cache = [0, ""]
+
+
+def today():
+    """Return today's date as YYYY-MM-DD, formatting it at most once per second."""
+    now = int(time.time())
+    if now != _date_cache[0]:
+        _date_cache[:] = [now, datetime.now().strftime('%Y-%m-%d')]
+    return _date_cache[1]
+
+
+def make_destination_dir_func(download_dir, config):
+    """
+    Build a function mapping a category to (dest_dir, rel_dir), with rel_dir
+    relative to download_dir. The organize_by_date/organize_by_type settings
+    are fixed for the life of the watcher, so they are resolved here once
+    instead of being re-checked for every file.
+    """
+    base = os.fspath(download_dir)
+    join = os.path.join
     
-    # Add date folder if configured
-    if config["organize_by_date"]:
-        dest_dir = dest_dir / date_folder
+    if config["organize_by_date"] and config["organize_by_type"]:
+        def destination_dir(category):
+            rel_dir = join(today(), category)
+            return join(base, rel_dir), rel_dir
+    elif config["organize_by_date"]:
+        def destination_dir(category):
+            rel_dir = today()
+            return join(base, rel_dir), rel_dir
+    elif config["organize_by_type"]:
+        def destination_dir(category):
+            return join(base, category), category
+    else:
+        def destination_dir(category):
+            return base, ""
     
-    # Add category folder if configured
-    if config["organize_by_type"]:
-        category = get_category(src_path, config["categories"])
-        dest_dir = dest_dir / category
+    return destination_dir
+
+
+def get_destination_path(src_path, dest_dir, rel_dir, config):
+    """
+    Determine the destination path for a file inside an existing dest_dir.
+    Returns (dest_path, rel_path), with rel_path relative to the Downloads folder.
+
+    With rename_duplicates on, the name is claimed by creating an empty file
+    there (O_EXCL), so concurrent moves can't pick the same name; the move
+    then replaces it, and the caller must remove it if the move fails.
+    """
+    # Handle file name (with duplicate detection)
+    name = os.path.basename(src_path)
+    dest_path = os.path.join(dest_dir, name)
     
-    # Create the directory if it doesn't exist
-    dest_dir.mkdir(parents=True, exist_ok=True)
+    if not config["rename_duplicates"]:
+        return dest_path, os.path.join(rel_dir, name)
     
-    # Handle file name (with duplicate detection)
-    dest_path = dest_dir / src_path.name
+    base_name, extension = os.path.splitext(name)
+    counter = 1
     
-    if config["rename_duplicates"] and dest_path.exists():
-        base_name = dest_path.stem
-        extension = dest_path.suffix
-        counter = 1
-        
-        while dest_path.exists():
-            new_name = f"{base_name} ({counter}){extension}"
-            dest_path = dest_dir / new_name
+    while True:
+        try:
+            os.close(os.open(dest_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            break
+        except FileExistsError:
+            name = f"{base_name} ({counter}){extension}"
+            dest_path = os.path.join(dest_dir, name)
             counter += 1
     
-    return dest_path
+    return dest_path, os.path.join(rel_dir, name)
 
 
 class DownloadHandler(FileSystemEventHandler):
@@ -165,72 +361,240 @@ class DownloadHandler(FileSystemEventHandler):
     def __init__(self, download_dir: Path, config: dict, logger):
         super().__init__()
         self.download_dir = download_dir
+        self._watch_dir = os.fspath(download_dir)
+        self._destination_dir = make_destination_dir_func(download_dir, config)
         self.config = config
         self.logger = logger
         self.delay = config["delay_seconds"]
         self.stats = {"total_organized": 0, "by_category": {}}
+        self._pending: dict[str, threading.Timer] = {}
+        self._queued: set = set()
+        self._stopping = False
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=MOVE_WORKERS, thread_name_prefix="mover")
+        self._known_dirs: set = set()
+    
+    def _wanted(self, src: str, log_skips=True):
+        """Return True if a new file should be organized."""
+        # Skip temporary files
+        if src.lower().endswith(TEMP_SUFFIXES):
+            return False
+        
+        # Skip our own config, log and marker files
+        name = os.path.basename(src)
+        if name in INTERNAL_FILES:
+            return False
+        
+        # Skip excluded files
+        if is_excluded(name, self.config):
+            if log_skips:
+                self.logger.info("Skipped excluded file: %s", name)
+            return False
+        
+        return True
     
     def on_created(self, event):
         if event.is_directory:
             return
 
-        src = Path(event.src_path)
+        src = event.src_path
+        if USE_INOTIFY:
+            # A new empty file is picked up when its writer closes it. One that
+            # already has data was either moved in from outside Downloads or is
+            # being written in place, so wait until its size stops changing; a
+            # close-write that arrives first still moves it straight away.
+            # Skips are logged from the close event so they aren't reported twice
+            try:
+                size = os.stat(src).st_size
+            except FileNotFoundError:
+                return
+            if size > 0 and self._wanted(src, log_skips=False):
+                self._schedule(src, size=size)
+            return
         
-        # Skip temporary files
-        if src.suffix.lower() in TEMP_EXTS:
+        if not self._wanted(src):
             return
         
-        # Skip excluded files
-        if is_excluded(src, self.config):
-            self.logger.info(f"Skipped excluded file: {src.name}")
+        self.logger.debug("New file detected: %s. Waiting for download completion...", os.path.basename(src))
+        self._schedule(src)
+    
+    def on_closed(self, event):
+        if event.is_directory:
+            return
+
+        src = event.src_path
+        if not self._wanted(src):
             return
         
-        # Wait for download to complete
-        self.logger.debug(f"New file detected: {src.name}. Waiting for download completion...")
-        time.sleep(self.delay)
+        # Browsers may create an empty placeholder before the real file is
+        # renamed over it; wait for that rename instead of moving the placeholder
+        try:
+            if os.stat(src).st_size == 0:
+                return
+        except FileNotFoundError:
+            return
         
-        # Check if file is still being written
-        prev_size = -1
-        while True:
+        self._submit(src)
+    
+    def on_moved(self, event):
+        if event.is_directory:
+            return
+
+        # A temp download renamed to its final name is complete
+        src = event.dest_path
+        if os.path.dirname(src) != self._watch_dir or not self._wanted(src):
+            return
+        
+        if USE_INOTIFY:
+            self._submit(src)
+        else:
+            self._schedule(src)
+    
+    def on_modified(self, event):
+        if event.is_directory:
+            return
+
+        src = event.src_path
+        
+        # Only reschedule files we are already waiting on
+        with self._lock:
+            if src not in self._pending:
+                return
+        self._schedule(src)
+    
+    def _schedule(self, src: str, delay=None, size=None):
+        """
+        (Re)start the debounce timer for a file; it fires once writes go quiet.
+        If `size` is given, the timer re-arms itself while the size keeps changing.
+        """
+        timer = threading.Timer(self.delay if delay is None else delay, self._on_quiet, args=(src, size))
+        timer.daemon = True
+        with self._lock:
+            if self._stopping:
+                return
+            previous = self._pending.get(src)
+            if previous is not None:
+                previous.cancel()
+            self._pending[src] = timer
+        timer.start()
+    
+    def _on_quiet(self, src: str, size=None):
+        """Debounce timer callback: move the file unless it is still being written."""
+        if size is not None:
             try:
-                curr_size = src.stat().st_size
-                if curr_size == prev_size:
-                    break
-                prev_size = curr_size
-                time.sleep(1)
+                current = os.stat(src).st_size
             except FileNotFoundError:
-                self.logger.info(f"File disappeared before organizing: {src.name}")
+                current = size  # let _finalize report it
+            if current != size:
+                self._schedule(src, size=current)
                 return
-            except PermissionError:
-                self.logger.info(f"File is locked by another process: {src.name}. Waiting...")
-                time.sleep(2)
         
-        # Get destination path
-        dest = get_destination_path(src, self.download_dir, self.config)
+        if writer_done(src):
+            self._submit(src)
+        else:
+            self._schedule(src, LOCK_RECHECK_DELAY, size)
+    
+    def _submit(self, src: str):
+        """Hand a file to the mover pool unless it is already queued or moving."""
+        # Submitting under the lock keeps stop() from shutting the pool in between
+        with self._lock:
+            if self._stopping:
+                return
+            timer = self._pending.pop(src, None)
+            if timer is not None:
+                timer.cancel()
+            if src not in self._queued:
+                self._queued.add(src)
+                self._pool.submit(self._process, src)
+    
+    def _process(self, src: str):
+        try:
+            self._finalize(src)
+        except Exception:
+            # Nobody reads the pool's futures, so report the failure here
+            self.logger.exception("Error organizing %s", os.path.basename(src))
+        finally:
+            with self._lock:
+                self._queued.discard(src)
+    
+    def stop(self):
+        """Cancel timers still waiting to fire and wait for in-progress moves."""
+        with self._lock:
+            self._stopping = True
+            for timer in self._pending.values():
+                timer.cancel()
+            self._pending.clear()
+        self._pool.shutdown(wait=True)
+    
+    def _ensure_dir(self, dest_dir: str):
+        """Create dest_dir unless it was already created this session."""
+        if dest_dir not in self._known_dirs:
+            os.makedirs(dest_dir, exist_ok=True)
+            self._known_dirs.add(dest_dir)
+    
+    def _finalize(self, src: str):
+        """Move a finished download into place."""
+        name = os.path.basename(src)
+        try:
+            os.stat(src)
+        except FileNotFoundError:
+            self.logger.info("File disappeared before organizing: %s", name)
+            return
         
-        # Move the file with retry logic
-        success = False
-        attempts = 0
-        max_attempts = self.config["max_retry_attempts"]
+        # Get destination path
+        category = get_category(src, self.config)
+        dest_dir, rel_dir = self._destination_dir(category)
+        if dest_dir == self._watch_dir:
+            # Neither date nor type folders are enabled, so the file is already in
+            # place; renaming it here would only trigger another event for itself
+            return
+        self._ensure_dir(dest_dir)
+        try:
+            dest, rel_dest = get_destination_path(src, dest_dir, rel_dir, self.config)
+        except FileNotFoundError:
+            # The cached folder was removed mid-session; recreate it and claim again
+            self._known_dirs.discard(dest_dir)
+            self._ensure_dir(dest_dir)
+            dest, rel_dest = get_destination_path(src, dest_dir, rel_dir, self.config)
         
-        while not success and attempts < max_attempts:
+        # Move the file, retrying briefly only while another process holds it
+        moved = False
+        max_attempts = max(1, self.config["max_retry_attempts"])
+        for attempt in range(max_attempts):
             try:
-                shutil.move(str(src), str(dest))
-                category = get_category(src, self.config["categories"])
-                
-                # Update statistics
-                self.stats["total_organized"] += 1
-                self.stats["by_category"][category] = self.stats["by_category"].get(category, 0) + 1
-                
-                self.logger.info(f"Moved: {src.name} → {dest.relative_to(self.download_dir)}")
-                success = True
-            except (OSError, PermissionError) as e:
-                attempts += 1
-                if attempts >= max_attempts:
-                    self.logger.error(f"Failed to move {src.name} after {max_attempts} attempts: {e}")
-                else:
-                    self.logger.warning(f"Error moving {src.name} (attempt {attempts}/{max_attempts}): {e}")
-                    time.sleep(self.config["retry_delay_seconds"])
+                fast_move(src, dest)
+                moved = True
+                break
+            except PermissionError as e:
+                if attempt + 1 < max_attempts:
+                    time.sleep(RETRY_BACKOFF * 2 ** attempt)
+                    continue
+                self.logger.error("Failed to move %s after %d attempts: %s", name, max_attempts, e)
+            except OSError as e:
+                # The folder may have been removed since it was cached
+                self._known_dirs.discard(dest_dir)
+                if isinstance(e, FileNotFoundError) and attempt + 1 < max_attempts and os.path.exists(src):
+                    self._ensure_dir(dest_dir)
+                    continue
+                self.logger.error("Error moving %s: %s", name, e)
+                break
+        
+        if not moved:
+            # Release the name claimed by get_destination_path
+            if self.config["rename_duplicates"]:
+                try:
+                    os.remove(dest)
+                except OSError:
+                    pass
+            return
+        
+        # Update statistics
+        with self._stats_lock:
+            self.stats["total_organized"] += 1
+            self.stats["by_category"][category] = self.stats["by_category"].get(category, 0) + 1
+        
+        self.logger.info("Moved: %s → %s", name, rel_dest)
 
 
 def perform_first_time_cleanup(downloads: Path, config: dict, logger):
@@ -247,28 +611,48 @@ def perform_first_time_cleanup(downloads: Path, config: dict, logger):
 
     old_download_folder = downloads / "old_download"
     old_download_folder.mkdir(exist_ok=True)
+    old_dir = os.fspath(old_download_folder)
+    skip = INTERNAL_FILES | {"old_download"}
 
     # Count files moved for reporting
     file_count = 0
     
-    for item in downloads.iterdir():
-        if item.name in {"old_download", MARKER_FILE, CONFIG_FILE, LOG_FILE}:
-            continue  # Skip self and config files
-        
-        if is_excluded(item, config):
-            logger.info(f"Skipping excluded item during initial cleanup: {item.name}")
-            continue
+    with os.scandir(downloads) as it:
+        for entry in it:
+            if entry.name in skip:
+                continue  # Skip self and config files
             
-        try:
-            shutil.move(str(item), str(old_download_folder / item.name))
-            logger.info(f"Moved: {item.name} → old_download/")
-            file_count += 1
-        except (OSError, PermissionError) as e:
-            logger.error(f"Error moving {item.name}: {e}")
+            if is_excluded(entry, config):
+                logger.info("Skipping excluded item during initial cleanup: %s", entry.name)
+                continue
+                
+            try:
+                fast_move(entry.path, os.path.join(old_dir, entry.name))
+                file_count += 1
+            except (OSError, PermissionError) as e:
+                logger.error("Error moving %s: %s", entry.name, e)
+                continue
+            
+            # Report progress in batches rather than per file
+            if file_count % CLEANUP_LOG_EVERY == 0:
+                logger.info("Moved %d items to old_download/ so far...", file_count)
 
     # Create a marker so we don't do this again
     marker.touch()
-    logger.info(f"Initial organization complete. Moved {file_count} items to old_download/")
+    logger.info("Initial organization complete. Moved %d items to old_download/", file_count)
+
+
+def start_stats_thread(event_handler, logger, stop_event, interval=STATS_INTERVAL):
+    """Log the running total every `interval` seconds until stop_event is set."""
+    def run():
+        while not stop_event.wait(interval):
+            total = event_handler.stats["total_organized"]
+            if total > 0:
+                logger.info("Stats: Organized %d files so far.", total)
+
+    thread = threading.Thread(target=run, name="stats", daemon=True)
+    thread.start()
+    return thread
 
 
 def display_config_info(config, logger):
@@ -329,24 +713,32 @@ def main():
     logger.info(f"Watching for new files...")
     event_handler = DownloadHandler(downloads, config, logger)
     observer = Observer()
-    observer.schedule(event_handler, str(downloads), recursive=False)
+    try:
+        observer.schedule(event_handler, str(downloads), recursive=False, event_filter=WATCHED_EVENTS)
+    except TypeError:  # watchdog < 4.0 has no event_filter
+        observer.schedule(event_handler, str(downloads), recursive=False)
     observer.start()
 
-    try:
-        while True:
-            time.sleep(60)  # Check stats periodically
-            stats = event_handler.stats
-            if stats["total_organized"] > 0:
-                logger.info(f"Stats: Organized {stats['total_organized']} files so far.")
-    except KeyboardInterrupt:
-        logger.info("Stopping organizer. Final stats:")
-        stats = event_handler.stats
-        logger.info(f"Total organized: {stats['total_organized']} files")
-        for category, count in stats["by_category"].items():
-            logger.info(f"  - {category}: {count} files")
-        observer.stop()
+    # Sleep until Ctrl+C (or a termination request) instead of waking periodically
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    start_stats_thread(event_handler, logger, stop_event)
+    
+    # Lock waits can't be interrupted by Ctrl+C on Windows, so poll there
+    wait_timeout = 1.0 if os.name == "nt" else None
+    while not stop_event.wait(wait_timeout):
+        pass
+    
+    logger.info("Stopping organizer. Final stats:")
+    stats = event_handler.stats
+    logger.info(f"Total organized: {stats['total_organized']} files")
+    for category, count in stats["by_category"].items():
+        logger.info(f"  - {category}: {count} files")
     
+    observer.stop()
     observer.join()
+    event_handler.stop()
 
 
 if __name__ == "__main__":